@@ -18,13 +18,18 @@ This version:
 
 import os
 import re
+import time
 import asyncio
 import logging
+from collections import OrderedDict
 from datetime import datetime, timedelta
 
-import aiohttp
+import ahocorasick
+import httpx
+import orjson
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     CommandHandler,
     MessageHandler,
@@ -32,6 +37,7 @@ from telegram.ext import (
     filters,
 )
 from telegram.constants import ParseMode
+from telegram.error import BadRequest, NetworkError, TimedOut
 
 # Logging
 logging.basicConfig(
@@ -42,25 +48,142 @@ logging.getLogger("apscheduler").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("telegram").setLevel(logging.WARNING)
 
+_NONDIGIT_RE = re.compile(r"\D")
+# deletes every ASCII non-digit; str.translate runs in C without the regex engine
+_KEEP_DIGITS = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit()))
+COUNTRY_CACHE_TTL = 24 * 60 * 60  # seconds
+COUNTRY_CACHE_MAX = 10_000
+SENT_NUMBERS_MAX = 50_000
+SEND_WORKERS = 4
+SEND_QUEUE_SIZE = 500
+SEND_DRAIN_TIMEOUT = 8  # seconds; stays inside the usual 10s SIGTERM grace period
+
+
+def _digits_only(s: str) -> str:
+    digits = s.translate(_KEEP_DIGITS)
+    if not digits.isascii():
+        # rare non-ASCII input: let the regex strip whatever is left
+        digits = _NONDIGIT_RE.sub("", digits)
+    return digits
+
+
+def mask_number(num: str) -> str:
+    s = str(num)
+    # the API already sends "+<digits>"; only strip when it doesn't
+    if s.startswith("+") and s[1:].isdigit():
+        clean = s[1:]
+    else:
+        clean = _digits_only(s)
+    if len(clean) > 6:
+        return "+" + clean[:5] + "*****" + clean[-3:]
+    return "+" + clean if clean else "N/A"
+
+
+def _parse_iso_z(s: str) -> datetime:
+    """Fast path for the API's "YYYY-MM-DDTHH:MM:SS(.fff)Z" timestamps."""
+    if len(s) >= 20 and s[-1] == "Z" and s[4] == "-" and s[7] == "-" and s[10] == "T":
+        return datetime(int(s[:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]), int(s[17:19]))
+    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+
 
 class TelegramOTPFetcher:
     def __init__(self, bot_token: str, chat_id: str, api_key: str | None = None):
         self.bot_token = bot_token
         self.chat_id = str(chat_id)
+        self.chat_id_int = int(chat_id)
         self.api_key = api_key or ""
-        self.application = Application.builder().token(self.bot_token).build()
-        self.otp_patterns = [
-            r"\b\d{4,8}\b",  # 4-8 digit codes
-            r"\b[A-Z0-9]{4,8}\b",  # Alphanumeric codes
-            r"verification code[:\s]*(\d+)",
-            r"your code[:\s]*(\d+)",
-            r"otp[:\s]*(\d+)",
-            r"code[:\s]*(\d+)",
-            r"pin[:\s]*(\d+)",
-        ]
+        self.application = (
+            Application.builder()
+            .token(self.bot_token)
+            # separate pools so long-poll getUpdates never starves outbound sends
+            .connection_pool_size(32)
+            .pool_timeout(20)
+            .get_updates_connection_pool_size(4)
+            .get_updates_pool_timeout(40)
+            .rate_limiter(AIORateLimiter())
+            .post_init(self._start_send_workers)
+            .post_stop(self._stop_send_workers)
+            .post_shutdown(self.shutdown)
+            .build()
+        )
+        # OTP patterns in priority order: a 4-8 digit code, then an alphanumeric
+        # code, then the first code after the highest-ranked label. search()
+        # stops at the first hit, and all labels share a single pass.
+        self.otp_labels = ("verification code", "your code", "otp", "code", "pin")
+        self._otp_digits_re = re.compile(r"\b\d{4,8}\b")
+        self._otp_alnum_re = re.compile(r"\b[A-Z0-9]{4,8}\b", re.IGNORECASE)
+        self._otp_labelled_re = re.compile(
+            rf"(?P<kw>{'|'.join(map(re.escape, self.otp_labels))})[:\s]*(?P<code>\d+)",
+            re.IGNORECASE,
+        )
+        self._otp_res = (self._otp_digits_re, self._otp_alnum_re, self._otp_labelled_re)
+        self._phone_re = re.compile(r"\+?\d{9,15}")
+        app_patterns = {
+            "claude": "Claude",
+            "openai": "OpenAI",
+            "chatgpt": "ChatGPT",
+            "google": "Google",
+            "facebook": "Facebook",
+            "instagram": "Instagram",
+            "twitter": "Twitter",
+            "x.com": "X (Twitter)",
+            "whatsapp": "WhatsApp",
+            "telegram": "Telegram",
+            "discord": "Discord",
+            "microsoft": "Microsoft",
+            "apple": "Apple",
+            "amazon": "Amazon",
+            "netflix": "Netflix",
+            "spotify": "Spotify",
+            "uber": "Uber",
+            "paypal": "PayPal",
+        }
+        # single-pass keyword matcher over all application names
+        self._app_ac = ahocorasick.Automaton()
+        for rank, (k, v) in enumerate(app_patterns.items()):
+            self._app_ac.add_word(k, (rank, v))
+        self._app_ac.make_automaton()
         self.api_base_url = "https://otprevenue.com/api/v1"
-        self.sent_numbers = set()
+        self._url_success = f"{self.api_base_url}/success-numbers"
+        self._url_country = f"{self.api_base_url}/phone-country/"
+        self._headers = {"X-API-Key": self.api_key}
+        # bounded LRU of already-announced success number ids
+        self.sent_numbers: OrderedDict[str, None] = OrderedDict()
         self.start_time = None
+        # static parts of every success-number notification
+        self._reply_markup = InlineKeyboardMarkup(
+            [
+                [
+                    InlineKeyboardButton("Bot", url="https://t.me/YourBotUsername"),
+                    InlineKeyboardButton("Group", url="https://t.me/YourGroupLink"),
+                ]
+            ]
+        )
+        self._bd_offset = timedelta(hours=6)  # UTC -> Bangladesh time
+        # adaptive success-number polling: cursor + current delay in seconds
+        self._last_seen_iso: str | None = None
+        self._interval = 10
+        self._min_interval = 2
+        self._max_interval = 60
+        # bounded LRU of phone prefix (first 6 digits) -> (monotonic fetched_at, country)
+        self._country_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        # digits-only phone -> pending lookup shared by concurrent callers
+        self._inflight: dict[str, asyncio.Future] = {}
+        # success-number notifications queue, drained by background workers
+        self._send_q: asyncio.Queue | None = None
+        self._send_workers: list[asyncio.Task] = []
+        self._sending = 0  # notifications a worker is currently sending
+        # one long-lived HTTP/2 client shared by all otprevenue API calls
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            headers=self._headers,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+
+    async def shutdown(self, application: Application | None = None):
+        """Close the shared HTTP client (registered as post_shutdown)."""
+        await self._http.aclose()
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Respond to /start"""
@@ -78,64 +201,43 @@ class TelegramOTPFetcher:
             else str(datetime.utcnow() - self.start_time).split(".")[0]
         )
         await update.message.reply_text(
-            f"✅ Bot status: running\nUptime: {uptime}\nPatterns loaded: {len(self.otp_patterns)}",
+            f"✅ Bot status: running\nUptime: {uptime}\nPatterns loaded: {len(self._otp_res)} ({len(self.otp_labels)} OTP labels)",
             parse_mode=ParseMode.MARKDOWN,
         )
 
-    async def extract_otp(self, text: str) -> str | None:
-        for pattern in self.otp_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                # some regex use capturing groups, others return plain strings
-                first = matches[0]
-                if isinstance(first, tuple):
-                    first = next((m for m in first if m), None)
-                return first
-        return None
+    def extract_otp(self, text: str) -> str | None:
+        # cheap reject for chatter with no digits before touching the regex engine
+        if text is None or len(text) < 4 or not any(ch.isdigit() for ch in text):
+            return None
+        m = self._otp_digits_re.search(text) or self._otp_alnum_re.search(text)
+        if m:
+            return m.group()
+        # first code of the highest-ranked label, as if each were searched in turn
+        labelled: dict[str, str] = {}
+        for m in self._otp_labelled_re.finditer(text):
+            labelled.setdefault(m.group("kw").lower(), m.group("code"))
+        return next((labelled[k] for k in self.otp_labels if k in labelled), None)
 
     def extract_application_name(self, text: str) -> str:
         text_lower = (text or "").lower()
-        app_patterns = {
-            "claude": "Claude",
-            "openai": "OpenAI",
-            "chatgpt": "ChatGPT",
-            "google": "Google",
-            "facebook": "Facebook",
-            "instagram": "Instagram",
-            "twitter": "Twitter",
-            "x.com": "X (Twitter)",
-            "whatsapp": "WhatsApp",
-            "telegram": "Telegram",
-            "discord": "Discord",
-            "microsoft": "Microsoft",
-            "apple": "Apple",
-            "amazon": "Amazon",
-            "netflix": "Netflix",
-            "spotify": "Spotify",
-            "uber": "Uber",
-            "paypal": "PayPal",
-        }
-        for p, n in app_patterns.items():
-            if p in text_lower:
-                return n
+        # keep the original first-listed-wins priority, not first-in-text
+        best = min((v for _, v in self._app_ac.iter(text_lower)), default=None)
+        if best is not None:
+            return best[1]
         return "Unknown App"
 
     def extract_phone_number(self, text: str) -> str | None:
-        if not text:
+        if text is None or len(text) < 4 or not any(ch.isdigit() for ch in text):
             return None
-        phone_patterns = [
-            r"\+?\d{9,15}",
-        ]
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return max(matches, key=len)
+        matches = self._phone_re.findall(text)
+        if matches:
+            return max(matches, key=len)
         return None
 
     def format_phone_number(self, phone_number: str) -> str:
         if not phone_number:
             return "Unknown"
-        digits = re.sub(r"\D", "", phone_number)
+        digits = _digits_only(phone_number)
         if len(digits) < 6:
             return phone_number
         return f"{digits[:3]}*****{digits[-3:]}"
@@ -144,101 +246,177 @@ class TelegramOTPFetcher:
         """Optional: Uses otprevenue lookup endpoint (if available)."""
         if not self.api_key or not phone_number:
             return "Unknown"
+        digits = _digits_only(phone_number)
+        key = digits[:6]
+        cached = self._country_cache.get(key)
+        if cached:
+            if time.monotonic() - cached[0] < COUNTRY_CACHE_TTL:
+                self._country_cache.move_to_end(key)
+                return cached[1]
+            del self._country_cache[key]
+        # single-flight: concurrent lookups for the same number share one request
+        inflight = self._inflight.get(digits)
+        if inflight is not None:
+            # shield so a cancelled waiter doesn't cancel the shared future
+            return await asyncio.shield(inflight)
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[digits] = fut
+        country = "Unknown"
+        try:
+            country = await self._fetch_country(phone_number, key)
+            return country
+        finally:
+            del self._inflight[digits]
+            if not fut.done():
+                fut.set_result(country)
+
+    async def _fetch_country(self, phone_number: str, key: str) -> str:
         try:
-            headers = {"X-API-Key": self.api_key}
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.api_base_url}/phone-country/{phone_number}"
-                async with session.get(url, headers=headers, timeout=10) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("country", "Unknown")
+            resp = await self._http.get(self._url_country + phone_number)
+            if resp.status_code == 200:
+                data = orjson.loads(resp.content)
+                country = data.get("country")
+                if not country:
+                    return "Unknown"
+                if key:
+                    self._cache_country(key, country)
+                return country
         except Exception as e:
             logging.debug("Country lookup failed: %s", e)
         return "Unknown"
 
-    async def send_success_numbers_to_group(self):
-        """Fetch new success numbers from the profile API and announce them."""
+    def _cache_country(self, key: str, country: str):
+        self._country_cache[key] = (time.monotonic(), country)
+        self._country_cache.move_to_end(key)
+        if len(self._country_cache) > COUNTRY_CACHE_MAX:
+            self._country_cache.popitem(last=False)
+
+    def _mark_sent(self, nid: str):
+        self.sent_numbers[nid] = None
+        self.sent_numbers.move_to_end(nid)
+        if len(self.sent_numbers) > SENT_NUMBERS_MAX:
+            self.sent_numbers.popitem(last=False)
+
+    async def _send_with_retry(self, **kwargs):
+        """bot.send_message with exponential backoff on transient network errors."""
+        delays = [0.5, 1, 2]
+        for delay in delays + [None]:
+            try:
+                return await self.application.bot.send_message(**kwargs)
+            except BadRequest:
+                # subclass of NetworkError, but retrying won't help
+                raise
+            except (TimedOut, NetworkError) as e:
+                if delay is None:
+                    raise
+                logging.debug("send_message failed (%s), retrying in %ss", e, delay)
+                await asyncio.sleep(delay)
+
+    def _build_success_payload(self, number: dict) -> dict:
+        """send_message kwargs announcing one success number."""
+        time_str = number.get("receivedAt", "N/A")
+        formatted_time = time_str
+        if time_str and time_str != "N/A":
+            try:
+                dt = _parse_iso_z(time_str)
+                bd_time = dt + self._bd_offset
+                formatted_time = bd_time.strftime("%d-%m-%Y %I:%M:%S %p")
+            except Exception:
+                formatted_time = time_str
+
+        country = number.get("country", "N/A")
+        phone_number = number.get("phoneNumber", "N/A")
+        otp_code = number.get("otpCode", "N/A")
+        service = number.get("service", "N/A")
+        full_message = number.get("fullMessage", "N/A")
+
+        masked_phone = mask_number(phone_number)
+
+        text = (
+            f"📬 \"{service}\" OTP Received!\n\n"
+            f"Number: {masked_phone}\n"
+            f"🔐OTP: {otp_code}\n"
+            f"Country: {country}\n"
+            f"Time: {formatted_time}\n\n"
+            f"Full Message:\n{full_message}"
+        )
+
+        # Send as plain text to avoid MarkdownV2 escaping issues from API text
+        return {
+            "chat_id": self.chat_id,
+            "text": text,
+            "disable_web_page_preview": True,
+            "reply_markup": self._reply_markup,
+        }
+
+    async def _send_worker(self):
+        while True:
+            phone_number, payload = await self._send_q.get()
+            self._sending += 1
+            try:
+                await self._send_with_retry(**payload)
+                logging.info("Sent new success number: %s", phone_number)
+            except Exception as e:
+                logging.error("Failed to send success number %s: %s", phone_number, e)
+            finally:
+                self._sending -= 1
+                self._send_q.task_done()
+
+    async def _start_send_workers(self, application: Application):
+        """Spawn the success-number send workers (registered as post_init)."""
+        self._send_q = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._send_workers = [asyncio.create_task(self._send_worker()) for _ in range(SEND_WORKERS)]
+
+    async def _stop_send_workers(self, application: Application):
+        """Drain and cancel the send workers before the bot is shut down (registered as post_stop)."""
+        if self._send_q is not None:
+            # queued ids are already marked sent and behind the after= cursor, so
+            # anything not delivered now would never be announced
+            try:
+                await asyncio.wait_for(self._send_q.join(), timeout=SEND_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logging.warning(
+                    "Dropping %d queued and %d in-flight success-number notification(s) on shutdown",
+                    self._send_q.qsize(),
+                    self._sending,
+                )
+        for task in self._send_workers:
+            task.cancel()
+        await asyncio.gather(*self._send_workers, return_exceptions=True)
+        self._send_workers = []
+
+    async def send_success_numbers_to_group(self) -> list[dict]:
+        """Fetch new success numbers from the profile API and announce them.
+
+        Returns the numbers that were new in this poll.
+        """
+        new = []
+        if self._send_q is None:
+            # send workers not started yet (post_init); leave numbers for the next poll
+            return new
         try:
             numbers = await self.get_recent_success_numbers_after_start(limit=50)
-            if not numbers:
-                return
-            new = []
-            for n in numbers:
+            for n in numbers or []:
                 nid = n.get("id")
                 if nid and nid not in self.sent_numbers:
+                    # hand off to the send workers so a large batch never blocks the
+                    # next poll; only mark as sent once it is actually queued
+                    await self._send_q.put((n.get("phoneNumber", "N/A"), self._build_success_payload(n)))
+                    self._mark_sent(nid)
                     new.append(n)
-                    self.sent_numbers.add(nid)
-            if not new:
-                return
-
-            for number in new:
-                time_str = number.get("receivedAt", "N/A")
-                formatted_time = time_str
-                if time_str and time_str != "N/A":
-                    try:
-                        dt = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-                        bd_time = dt + timedelta(hours=6)
-                        formatted_time = bd_time.strftime("%d-%m-%Y %I:%M:%S %p")
-                    except Exception:
-                        formatted_time = time_str
-
-                country = number.get("country", "N/A")
-                phone_number = number.get("phoneNumber", "N/A")
-                otp_code = number.get("otpCode", "N/A")
-                service = number.get("service", "N/A")
-                full_message = number.get("fullMessage", "N/A")
-
-                def mask_number(num: str) -> str:
-                    clean = re.sub(r"\D", "", str(num))
-                    if len(clean) > 6:
-                        return clean[:5] + "*****" + clean[-3:]
-                    return clean or "N/A"
-
-                masked_phone = mask_number(phone_number)
-                if masked_phone and not masked_phone.startswith("+"):
-                    masked_phone = "+" + masked_phone
-
-                text = (
-                    f"📬 \"{service}\" OTP Received!\n\n"
-                    f"Number: {masked_phone}\n"
-                    f"🔐OTP: {otp_code}\n"
-                    f"Country: {country}\n"
-                    f"Time: {formatted_time}\n\n"
-                    f"Full Message:\n{full_message}"
-                )
-
-                keyboard = [
-                    [
-                        InlineKeyboardButton("Bot", url="https://t.me/YourBotUsername"),
-                        InlineKeyboardButton("Group", url="https://t.me/YourGroupLink"),
-                    ]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-
-                # Send as plain text to avoid MarkdownV2 escaping issues from API text
-                await self.application.bot.send_message(
-                    chat_id=self.chat_id,
-                    text=text,
-                    disable_web_page_preview=True,
-                    reply_markup=reply_markup,
-                )
-
-                logging.info("Sent new success number: %s", phone_number)
 
         except Exception as e:
             logging.error("Error sending success numbers: %s", e)
+        return new
 
     async def get_recent_success_numbers(self, limit: int = 5):
         if not self.api_key:
             return []
         try:
-            headers = {"X-API-Key": self.api_key}
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.api_base_url}/success-numbers?page=1&limit={limit}"
-                async with session.get(url, headers=headers, timeout=10) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("data", {}).get("numbers", [])
+            resp = await self._http.get(self._url_success, params={"page": 1, "limit": limit})
+            if resp.status_code == 200:
+                data = orjson.loads(resp.content)
+                return data.get("data", {}).get("numbers", [])
         except Exception as e:
             logging.debug("get_recent_success_numbers failed: %s", e)
         return []
@@ -247,28 +425,25 @@ class TelegramOTPFetcher:
         if not self.start_time:
             return await self.get_recent_success_numbers(limit)
         try:
-            start_time_iso = self.start_time.isoformat()
-            headers = {"X-API-Key": self.api_key}
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.api_base_url}/success-numbers?page=1&limit={limit}&after={start_time_iso}"
-                async with session.get(url, headers=headers, timeout=10) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        return data.get("data", {}).get("numbers", [])
+            after_iso = self._last_seen_iso or self.start_time.isoformat()
+            resp = await self._http.get(
+                self._url_success, params={"page": 1, "limit": limit, "after": after_iso}
+            )
+            if resp.status_code == 200:
+                data = orjson.loads(resp.content)
+                return data.get("data", {}).get("numbers", [])
         except Exception as e:
             logging.debug("get_recent_success_numbers_after_start failed: %s", e)
         return []
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        # Only monitor the configured group (checked before any regex work)
+        if update.effective_chat is None or update.effective_chat.id != self.chat_id_int:
+            return
         if update.message and update.message.text:
             message_text = update.message.text
-            chat_id = str(update.effective_chat.id)
-
-            # Only monitor the configured group
-            if chat_id != self.chat_id:
-                return
 
-            otp = await self.extract_otp(message_text)
+            otp = self.extract_otp(message_text)
             if not otp:
                 return
 
@@ -283,7 +458,7 @@ class TelegramOTPFetcher:
             country = await self.get_country_from_database(phone_number)
             current_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
 
-            response = f"*{application_name}* OTP Detected!\n\n"
+            response = f"{application_name} OTP Detected!\n\n"
             response += f"Number: {formatted_number}\n"
             response += f"OTP: {otp}\n"
             response += f"Application: {application_name}\n"
@@ -291,37 +466,68 @@ class TelegramOTPFetcher:
             response += f"Time: {current_time}\n\n"
             response += f"Full Message:\n{message_text}"
 
-            # Use Markdown (basic) but keep content simple
+            # Plain text: the forwarded message body could break Markdown parsing
             await context.bot.send_message(
                 chat_id=self.chat_id,
                 text=response,
-                parse_mode=ParseMode.MARKDOWN,
             )
 
-            logging.info("OTP extracted: %s from group %s", otp, chat_id)
+            logging.info("OTP extracted: %s from group %s", otp, self.chat_id)
 
     async def error_handler(self, update: object, context: ContextTypes.DEFAULT_TYPE):
         logging.error("Exception while handling an update:", exc_info=context.error)
 
     def run(self):
+        # faster event loop for all the socket I/O, when available
+        try:
+            import uvloop
+
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
         # set start time
         self.start_time = datetime.utcnow()
 
         self.application.add_handler(CommandHandler("start", self.start))
         self.application.add_handler(CommandHandler("status", self.status))
-        self.application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, self.handle_message))
+        self.application.add_handler(
+            MessageHandler(
+                filters.Chat(chat_id=self.chat_id_int) & filters.TEXT & ~filters.COMMAND,
+                self.handle_message,
+            )
+        )
         self.application.add_error_handler(self.error_handler)
 
-        # job queue to fetch success numbers every 10 seconds (adjustable by env)
-        interval = int(os.environ.get("POLL_INTERVAL", "10"))
+        # job queue to fetch success numbers; starts at POLL_INTERVAL and adapts
+        # between POLL_MIN_INTERVAL and POLL_MAX_INTERVAL depending on activity
+        self._interval = int(os.environ.get("POLL_INTERVAL", "10"))
+        self._min_interval = int(os.environ.get("POLL_MIN_INTERVAL", "2"))
+        self._max_interval = int(os.environ.get("POLL_MAX_INTERVAL", "60"))
+        if not 1 <= self._min_interval <= self._interval <= self._max_interval:
+            raise RuntimeError(
+                "Poll intervals must satisfy 1 <= POLL_MIN_INTERVAL <= POLL_INTERVAL <= POLL_MAX_INTERVAL."
+            )
         first = int(os.environ.get("POLL_FIRST", "10"))
-        self.application.job_queue.run_repeating(self.check_and_send_success_numbers, interval=interval, first=first)
+        self.application.job_queue.run_once(self.check_and_send_success_numbers, when=first)
 
         logging.info("Starting Telegram OTP Fetcher (polling)...")
         self.application.run_polling(allowed_updates=Update.ALL_TYPES)
 
     async def check_and_send_success_numbers(self, context: ContextTypes.DEFAULT_TYPE):
-        await self.send_success_numbers_to_group()
+        new = []
+        try:
+            new = await self.send_success_numbers_to_group()
+        finally:
+            # halve the delay after a hit, double it on a miss
+            if new:
+                received = [n["receivedAt"] for n in new if n.get("receivedAt")]
+                if received:
+                    self._last_seen_iso = max(received)
+                self._interval = max(self._min_interval, self._interval // 2)
+            else:
+                self._interval = min(self._max_interval, self._interval * 2)
+            context.job_queue.run_once(self.check_and_send_success_numbers, when=self._interval)
 
 
 def get_env(var: str, default: str | None = None, required: bool = False) -> str: